@@ -26,20 +26,56 @@ Can be modified to spesific scenarios.
 import os
 import math
 import json
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Callable
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple, Callable
 
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")              # headless: no GUI backend init cost
 import matplotlib.pyplot as plt
 import opendssdirect as dss
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    # numba is optional: fall back to plain Python (same results, slower)
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+try:
+    import h5py
+    HAVE_H5PY = True
+except ImportError:
+    # h5py is optional: without it every run re-simulates all scenarios
+    HAVE_H5PY = False
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    # orjson is optional: stdlib json writes the same summary, slower
+    HAVE_ORJSON = False
+
 
 
 
 MASTER_DSS = "master.dss"          # relative path
 RESULTS_DIR = "results"            # all plots saved here
+CACHE_H5 = os.path.join(RESULTS_DIR, "scenario_cache.h5")   # simulation cache
 
 MINUTES = 1440                     # 24h * 60min
+PLOT_DPI = int(os.environ.get("PLOT_DPI", "100"))   # raise for final figures
 HOMES = ["home1","home2","home3","home4","home5","home6","home7","home8","home9","home10"]
 
 
@@ -50,6 +86,13 @@ PV_CHARGE_KW = 10.0
 PV_CHARGE_MIN_KW = 2.0
 SOC_MAX_CHARGE = 95.0
 
+# Variable-timestep solving: in quiet grid-connected windows (no event close,
+# BESS idle, PV flat) solve every COARSE_STEP minutes and interpolate the
+# skipped samples. Set COARSE_STEP = 1 to always solve per minute.
+COARSE_STEP = 5
+COARSE_EVENT_GAP = 10              # min distance (minutes) to the next event
+PV_SMOOTH_EPS_KW = 0.05            # max PV ramp per minute to call it quiet
+
 
 
 @dataclass
@@ -146,20 +189,50 @@ def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def limit_power(val: float) -> float:
-    """Avoid NaN / numeric blow-ups """
-    if val is None:
-        return 0.0
-    if isinstance(val, float) and (math.isnan(val) or abs(val) > 1e6):
+@njit(cache=True)
+def _clip(v: float) -> float:
+    """Avoid NaN / numeric blow-ups (v != v is the branch-light NaN test)"""
+    if v != v or v > 1e6 or v < -1e6:
         return 0.0
-    return float(val)
+    return v
+
+
+# master file currently held by the OpenDSS engine (per process)
+_compiled_master: Optional[str] = None
+
+# everything a scenario's events (or the BESS control) may have touched,
+# restored to the model defaults from lines.dss / generators.dss
+_RESET_COMMANDS = (
+    "edit line.sw1 enabled=yes",
+    "edit line.sw2 enabled=yes",
+    "edit line.sw3 enabled=yes",
+    "edit line.sw4 enabled=yes",
+    "edit line.sw5 enabled=yes",
+    "edit line.mbs_s1 enabled=no",
+    "edit line.mbs_s2 enabled=no",
+    "edit vsource.dummy_1 enabled=no",
+    "edit Storage.mobilebat State=IDLING kW=0 %stored=40",
+    "set mode=daily stepsize=1m number=1",
+    "set hour=0 sec=0",
+)
 
 
 def compile_model(master_dss: str) -> None:
-    """Compile DSS model"""
-    dss.Command("clear")
-    dss.Command(f"compile '{master_dss}'")
-    dss.Command("set mode=daily stepsize=1m number=1")
+    """
+    Compile DSS model. The parse is the expensive part and the file does not
+    change between scenarios, so later calls for the same master only replay
+    a reset script restoring event-touched elements to their defaults.
+    """
+    global _compiled_master
+    if _compiled_master != master_dss:
+        dss.Text.Commands(
+            "clear\n"
+            f"compile '{master_dss}'\n"
+            "set mode=daily stepsize=1m number=1"
+        )
+        _compiled_master = master_dss
+    else:
+        dss.Text.Commands("\n".join(_RESET_COMMANDS))
 
 
 def set_pv_profile(shape_name: str) -> None:
@@ -181,42 +254,85 @@ def get_pv_kw() -> float:
     """Read PV power (kW). Convention: -Powers()[0] gives generation in your scripts"""
     p = 0.0
     if dss.Circuit.SetActiveElement("PVSystem.pv1") and dss.CktElement.Enabled():
-        p = limit_power(-dss.CktElement.Powers()[0])
+        p = _clip(-dss.CktElement.Powers()[0])
     return p
 
 
-def get_total_load_kw(homes: List[str]) -> float:
-    """Sum total household demand (kW) similarly to your approach"""
+@njit(cache=True)
+def _sum_load_kw(buf: np.ndarray) -> float:
+    """Reduce the (loads, 6) power scratch buffer: abs real-part sum per load."""
     total = 0.0
-    for h in homes:
-        if dss.Circuit.SetActiveElement(f"Load.{h}"):
-            pw = dss.CktElement.Powers()
-            if pw:
-                # single-phase may still return list; keep your pattern
-                total += abs(limit_power(sum(pw[0:6:2])))
+    for i in range(buf.shape[0]):
+        s = buf[i, 0] + buf[i, 2] + buf[i, 4]
+        if np.isnan(s) or abs(s) > 1e6:
+            s = 0.0
+        total += abs(s)
     return total
 
 
-def get_bus_voltage_v(bus_name: str) -> float:
-    dss.Circuit.SetActiveBus(bus_name)
-    vm = dss.Bus.VMagAngle()
-    if (vm is None) or (len(vm) < 1):
-        return 0.0
-    v = vm[0]
-    if math.isnan(v) or v > 1e4:
-        return 0.0
-    return float(v)
+def get_total_load_kw(load_buf: np.ndarray) -> float:
+    """Sum total household demand (kW) in one pass over the Loads collection"""
+    i = dss.Loads.First()
+    while i:
+        pw = dss.CktElement.Powers()
+        if pw:
+            # single-phase may still return list; copy into the scratch row
+            n = min(len(pw), 6)
+            load_buf[i - 1, :n] = pw[:n]
+        i = dss.Loads.Next()
+    return _sum_load_kw(load_buf)
+
+
+def home_node_indices(homes: List[str]) -> np.ndarray:
+    """
+    Map each home bus to its position in Circuit.AllNodeNames so the per-minute
+    voltage read is one AllBusVMag call + one fancy-index instead of a
+    SetActiveBus round-trip per home. Single-phase model => node ".1".
+    """
+    names = [n.lower() for n in dss.Circuit.AllNodeNames()]
+    return np.array([names.index(f"{h.lower()}.1") for h in homes], dtype=np.int64)
+
+
+@njit(cache=True)
+def _gather_voltages(vmags: np.ndarray, idx: np.ndarray, out_col: np.ndarray) -> None:
+    """Gather home voltages by node index with the NaN/blow-up clip, in place."""
+    for i in range(idx.shape[0]):
+        v = vmags[idx[i]]
+        if np.isnan(v) or v > 1e4:
+            v = 0.0
+        out_col[i] = v
+
+
+def read_home_voltages(home_idx: np.ndarray, out_col: np.ndarray) -> None:
+    """One bulk AllBusVMag call, then a JITed gather into the results column."""
+    vmags = np.asarray(dss.Circuit.AllBusVMag())
+    _gather_voltages(vmags, home_idx, out_col)
+
+
+# typed Storages interface (newer opendssdirect); avoids the string property
+# parse of %stored on the hot path
+HAVE_STORAGES_API = hasattr(dss, "Storages")
 
 
 def get_bess_soc_and_power() -> Tuple[float, float]:
-    
+
     """
-    Read Storage.mobilebat SoC and power. 
+    Read Storage.mobilebat SoC and power.
     """
     soc = 0.0
     p_bat = 0.0
 
-    if dss.Circuit.SetActiveElement("Storage.mobilebat"):
+    if HAVE_STORAGES_API and dss.Storages.First():
+        # First() also makes the storage the active element
+        soc_raw = dss.Storages.puSOC() * 100.0
+        soc = soc_raw if not math.isnan(soc_raw) else soc
+
+        pw = dss.CktElement.Powers()
+        if pw:
+            p_bat = abs(_clip(sum(pw[0:6:2])))
+
+    elif dss.Circuit.SetActiveElement("Storage.mobilebat"):
+        # legacy path: string-keyed property lookup
         try:
             soc_raw = float(dss.Properties.Value("%stored"))
             soc = soc_raw if not math.isnan(soc_raw) else soc
@@ -225,45 +341,70 @@ def get_bess_soc_and_power() -> Tuple[float, float]:
 
         pw = dss.CktElement.Powers()
         if pw:
-            p_bat = abs(limit_power(sum(pw[0:6:2])))
+            p_bat = abs(_clip(sum(pw[0:6:2])))
 
     return soc, p_bat
 
 
-def bess_control_step(is_island: bool, pv_kw: float, prev_soc: float, enabled: bool) -> float:
-    
+# BESS state codes returned by _bess_decide
+BESS_IDLE = 0
+BESS_DISCHARGE = 1
+BESS_CHARGE = 2
+
+
+@njit(cache=True)
+def _bess_decide(is_island: bool, soc: float, pv_kw: float,
+                 reserve: float, hyst: float, target_kw: float,
+                 pv_min_kw: float, pv_charge_kw: float, soc_max: float) -> Tuple[int, float]:
     """
-      - In island: discharge to meet target (TARGET_LOAD - PV)
-      - Stop/idle if SoC below reserve threshold (RESERVE_PCT + SOC_HYST)
-      - In grid-connected: optionally charge from PV if available & SoC < SOC_MAX_CHARGE
+    Pure-numeric BESS decision (JIT-compiled): returns (state_code, kW).
+      - In island: discharge to meet target (target_kw - PV)
+      - Stop/idle if SoC below reserve threshold (reserve + hyst)
+      - In grid-connected: charge from PV if available & SoC < soc_max
+    """
+    if is_island:
+        if soc <= reserve + hyst:
+            return BESS_IDLE, 0.0
+        kw = target_kw - pv_kw
+        if kw < 0.0:
+            kw = 0.0
+        return BESS_DISCHARGE, kw
+    if pv_kw > pv_min_kw and soc < soc_max:
+        return BESS_CHARGE, pv_charge_kw
+    return BESS_IDLE, 0.0
+
+
+def bess_control_step(is_island: bool, pv_kw: float, prev_soc: float, enabled: bool) -> Tuple[float, float]:
+
+    """
+    Read SoC + power once, run the JITed decision kernel, and issue the
+    resulting storage command. Returns (soc, bat_kw) so the caller does not
+    need a second OpenDSS round-trip for the same state.
     """
     if not enabled:
         dss.Command("edit Storage.mobilebat State=IDLING kW=0")
-        return prev_soc
+        soc, bat_kw = get_bess_soc_and_power()
+        if soc <= 0:
+            soc = prev_soc
+        return soc, bat_kw
 
-    # read current soc
-    soc, _ = get_bess_soc_and_power()
+    # single read of current soc + power for this minute
+    soc, bat_kw = get_bess_soc_and_power()
     if soc <= 0:
         soc = prev_soc if prev_soc > 0 else 40.0
 
-    if is_island:
-        soc_stop = RESERVE_PCT + (SOC_HYST or 0.0)
-        if soc <= soc_stop:
-            dss.Command("edit Storage.mobilebat State=IDLING kW=0")
-        else:
-            discharge_kw = max(0.0, TARGET_LOAD_KW - pv_kw)
-            dss.Command(f"edit Storage.mobilebat State=DISCHARGING kW={discharge_kw}")
-    else:
-        # charge only if PV exists and SoC not full
-        if pv_kw > PV_CHARGE_MIN_KW and soc < SOC_MAX_CHARGE:
-            dss.Command(f"edit Storage.mobilebat State=CHARGING kW={PV_CHARGE_KW}")
-        else:
-            dss.Command("edit Storage.mobilebat State=IDLING kW=0")
+    state, kw = _bess_decide(is_island, soc, pv_kw,
+                             RESERVE_PCT, SOC_HYST or 0.0, TARGET_LOAD_KW,
+                             PV_CHARGE_MIN_KW, PV_CHARGE_KW, SOC_MAX_CHARGE)
 
-        if soc >= SOC_MAX_CHARGE:
-            dss.Command("edit Storage.mobilebat State=IDLING kW=0")
+    if state == BESS_DISCHARGE:
+        dss.Command(f"edit Storage.mobilebat State=DISCHARGING kW={kw}")
+    elif state == BESS_CHARGE:
+        dss.Command(f"edit Storage.mobilebat State=CHARGING kW={kw}")
+    else:
+        dss.Command("edit Storage.mobilebat State=IDLING kW=0")
 
-    return soc
+    return soc, bat_kw
 
 
 
@@ -273,98 +414,216 @@ class ScenarioResults:
     minutes: int
     homes: List[str]
 
-    pv_kw: List[float]
-    bat_kw: List[float]
-    soc_pct: List[float]
-    load_kw: List[float]
-    supply_kw: List[float]
-    island_flag: List[int]
-    voltages: Dict[str, List[float]]
+    # preallocated per-minute float32 arrays (index = minute); single
+    # precision is plenty for plotting and the JSON summary, and halves
+    # the bytes moved in reductions and cache writes
+    pv_kw: np.ndarray
+    bat_kw: np.ndarray
+    soc_pct: np.ndarray
+    load_kw: np.ndarray
+    supply_kw: np.ndarray
+    island_flag: np.ndarray
+    voltages: np.ndarray     # SoA layout, shape (len(homes), minutes), float32
+    home_index: Dict[str, int]   # home name -> row in voltages
 
-    stability_minutes: int  
+    stability_minutes: int
 
 
 def init_results(minutes: int, homes: List[str]) -> ScenarioResults:
     return ScenarioResults(
         minutes=minutes,
         homes=homes,
-        pv_kw=[],
-        bat_kw=[],
-        soc_pct=[],
-        load_kw=[],
-        supply_kw=[],
-        island_flag=[],
-        voltages={h: [] for h in homes},
+        home_index={h: i for i, h in enumerate(homes)},
+        pv_kw=np.zeros(minutes, dtype=np.float32),
+        bat_kw=np.zeros(minutes, dtype=np.float32),
+        soc_pct=np.zeros(minutes, dtype=np.float32),
+        load_kw=np.zeros(minutes, dtype=np.float32),
+        supply_kw=np.zeros(minutes, dtype=np.float32),
+        island_flag=np.zeros(minutes, dtype=np.float32),
+        voltages=np.zeros((len(homes), minutes), dtype=np.float32),
         stability_minutes=0,
     )
 
 
 
+# RESULTS CACHE (HDF5, optional)
+
+_CACHED_FIELDS = ("pv_kw", "bat_kw", "soc_pct", "load_kw",
+                  "supply_kw", "island_flag", "voltages")
+
+
+def scenario_cache_key(cfg: ScenarioConfig) -> str:
+    """Hash of scenario config + master file mtime; any change invalidates."""
+    payload = json.dumps(asdict(cfg), sort_keys=True) + str(os.path.getmtime(MASTER_DSS))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def load_cached_results(cfg: ScenarioConfig) -> Optional[ScenarioResults]:
+    """Return cached ScenarioResults for cfg, or None on miss."""
+    if not HAVE_H5PY or not os.path.exists(CACHE_H5):
+        return None
+    key = scenario_cache_key(cfg)
+    with h5py.File(CACHE_H5, "r") as f:
+        if key not in f:
+            return None
+        g = f[key]
+        res = init_results(MINUTES, HOMES)
+        for name in _CACHED_FIELDS:
+            getattr(res, name)[...] = g[name][...]
+        res.stability_minutes = int(g.attrs["stability_minutes"])
+    return res
+
+
+def save_cached_results(cfg: ScenarioConfig, res: ScenarioResults) -> None:
+    if not HAVE_H5PY:
+        return
+    key = scenario_cache_key(cfg)
+    with h5py.File(CACHE_H5, "a") as f:
+        if key in f:
+            del f[key]
+        g = f.create_group(key)
+        for name in _CACHED_FIELDS:
+            g.create_dataset(name, data=getattr(res, name), compression="lzf")
+        g.attrs["stability_minutes"] = res.stability_minutes
+        g.attrs["scenario"] = cfg.name
+
+
 # PLOTS
 
-def plot_power_flow(res: ScenarioResults, title: str, out_png: str) -> None:
-  
+def draw_power_flow(ax, res: ScenarioResults) -> None:
+
     """
     Plot PV, BESS, total load, total supply.
     """
-    plt.figure(figsize=(12, 6), dpi=160)
-    plt.plot(res.pv_kw, label="PV Output (kW)", linewidth=2.0)
-    plt.plot(res.bat_kw, label="BESS Discharge (kW)", linestyle="--", linewidth=2.0)
-    plt.plot(res.load_kw, label="Total Demand (kW)", linestyle="-.", linewidth=2.0)
-    plt.plot(res.supply_kw, label="Total Supply (PV + BESS)", linestyle=":", linewidth=2.5)
+    # one plot call for all four series: fewer artist creations per figure
+    Y = np.column_stack([res.pv_kw, res.bat_kw, res.load_kw, res.supply_kw])
+    styles = [
+        ("-",  2.0, "PV Output (kW)"),
+        ("--", 2.0, "BESS Discharge (kW)"),
+        ("-.", 2.0, "Total Demand (kW)"),
+        (":",  2.5, "Total Supply (PV + BESS)"),
+    ]
+    for line, (ls, lw, lbl) in zip(ax.plot(Y), styles):
+        line.set_linestyle(ls)
+        line.set_linewidth(lw)
+        line.set_label(lbl)
+
+    ax.set_ylabel("Power (kW)")
+    ax.grid(True, alpha=0.3)
+
+
+@njit(cache=True, parallel=True)
+def voltage_stats(V: np.ndarray) -> np.ndarray:
+    """
+    Fused NaN-aware per-minute reductions over the (homes, minutes) voltage
+    array: one pass instead of separate nanmin/nanmax/nanmean.
+    Returns a (3, minutes) array: rows = min, max, mean.
+    """
+    H, T = V.shape
+    out = np.empty((3, T), dtype=np.float64)
+    for t in prange(T):
+        vmin = np.inf
+        vmax = -np.inf
+        vsum = 0.0
+        n = 0
+        for h in range(H):
+            v = V[h, t]
+            if not np.isnan(v):
+                if v < vmin:
+                    vmin = v
+                if v > vmax:
+                    vmax = v
+                vsum += v
+                n += 1
+        if n == 0:
+            out[0, t] = np.nan
+            out[1, t] = np.nan
+            out[2, t] = np.nan
+        else:
+            out[0, t] = vmin
+            out[1, t] = vmax
+            out[2, t] = vsum / n
+    return out
 
-    plt.title(title, fontsize=13, fontweight="bold")
-    plt.xlabel("Time (minutes)")
-    plt.ylabel("Power (kW)")
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(out_png, bbox_inches="tight")
-    plt.close()
 
+def draw_voltage_band(ax, res: ScenarioResults, vref: float) -> None:
 
-def plot_voltage_band_and_soc(res: ScenarioResults, title: str, out_png: str, vref: float = 230.0) -> None:
+    """
+    Voltage band + mean voltage + reference line.
+    """
+    t = np.arange(res.minutes)
+
+    v_min, v_max, v_mean = voltage_stats(res.voltages)
+
+    LW = 2
+    ax.fill_between(t, v_min, v_max, alpha=0.20, label="Voltage range", linewidth=0)
+    ax.plot(t, v_mean, linewidth=LW, label="Mean voltage")
+    ax.axhline(vref, linestyle="--", linewidth=LW, label=f"{vref:.0f} V reference")
+
+    ax.set_ylabel("Voltage (V)")
+    ax.grid(True, alpha=0.3)
+
+
+def draw_soc(ax, res: ScenarioResults) -> None:
 
     """
-      TOP: voltage band  + mean voltage + reference line
-      BOTTOM: SoC (%)
+    Battery SoC (%).
     """
     t = np.arange(res.minutes)
 
-    V = np.vstack([np.array(res.voltages[h], dtype=float) for h in res.homes])
-    v_min = np.nanmin(V, axis=0)
-    v_max = np.nanmax(V, axis=0)
-    v_mean = np.nanmean(V, axis=0)
+    LW = 2
+    ax.plot(t, res.soc_pct, linewidth=LW, label="Battery SoC (%)")
+    ax.fill_between(t, res.soc_pct, alpha=0.20)
+    ax.set_ylabel("SoC (%)")
+    ax.set_xlabel("Time (minutes)")
+    ax.grid(True, alpha=0.3)
+
+
+def plot_scenario(res: ScenarioResults, title: str, out_png: str, vref: float = 230.0) -> None:
 
-    fig, (axV, axS) = plt.subplots(
-        2, 1,
-        figsize=(12, 6),
-        dpi=180,
+    """
+    One shared figure per scenario (single backend init + PNG encode):
+      TOP: power flow
+      MIDDLE: voltage band + mean voltage + reference line
+      BOTTOM: SoC (%)
+    """
+    fig, axes = plt.subplots(
+        3, 1,
+        figsize=(12, 9),
+        dpi=PLOT_DPI,
         sharex=True,
-        gridspec_kw={"height_ratios": [2.2, 1.0]}
+        constrained_layout=True,
+        gridspec_kw={"height_ratios": [2.0, 2.2, 1.0]}
     )
 
-    LW = 2
-    axV.fill_between(t, v_min, v_max, alpha=0.20, label="Voltage range", linewidth=0)
-    axV.plot(t, v_mean, linewidth=LW, label="Mean voltage")
-    axV.axhline(vref, linestyle="--", linewidth=LW, label=f"{vref:.0f} V reference")
-
-    axV.set_ylabel("Voltage (V)")
-    axV.grid(True, alpha=0.3)
-    axV.set_title(title, fontsize=12, fontweight="bold")
+    draw_power_flow(axes[0], res)
+    draw_voltage_band(axes[1], res, vref)
+    draw_soc(axes[2], res)
 
-    axS.plot(t, res.soc_pct, linewidth=LW, label="Battery SoC (%)")
-    axS.fill_between(t, res.soc_pct, alpha=0.20)
-    axS.set_ylabel("SoC (%)")
-    axS.set_xlabel("Time (minutes)")
-    axS.grid(True, alpha=0.3)
+    axes[0].set_title(title, fontsize=12, fontweight="bold")
 
-    plt.tight_layout()
-    plt.savefig(out_png, bbox_inches="tight")
-    plt.close()
+    fig.savefig(out_png, pil_kwargs={"compress_level": 1})
+    plt.close(fig)
 
 
 #SIMULATION
 
+def _fill_skipped_minutes(res: ScenarioResults, t_end: int, step: int) -> None:
+    """
+    Linear interpolation of the samples skipped by a coarse solve ending at
+    minute t_end. Coarse windows are grid-connected with the BESS idle by
+    construction, so island_flag stays 0 across the gap.
+    """
+    t_prev = t_end - step
+    for k in range(1, step):
+        idx = t_prev + k
+        frac = k / step
+        for arr in (res.pv_kw, res.bat_kw, res.soc_pct, res.load_kw, res.supply_kw):
+            arr[idx] = arr[t_prev] + frac * (arr[t_end] - arr[t_prev])
+        res.voltages[:, idx] = (res.voltages[:, t_prev]
+                                + frac * (res.voltages[:, t_end] - res.voltages[:, t_prev]))
+        res.island_flag[idx] = 0
+
 def run_scenario(cfg: ScenarioConfig) -> ScenarioResults:
     """
     PSEUDO-ALGORITHM (expanded):
@@ -389,47 +648,81 @@ def run_scenario(cfg: ScenarioConfig) -> ScenarioResults:
 
     res = init_results(MINUTES, HOMES)
 
-    prev_soc = 40.0  # safe default
+    home_idx = home_node_indices(HOMES)   # fixed for a compiled model
+    load_buf = np.zeros((dss.Loads.Count(), 6), dtype=np.float64)  # scratch for get_total_load_kw
 
-    for t in range(MINUTES):
+    # events as a sorted queue: advance a pointer instead of a dict probe per
+    # minute; each batch is pre-joined once into the Text.Commands script so
+    # event minutes reuse the same string instead of rebuilding it
+    events = sorted((minute, "\n".join(cmds)) for minute, cmds in cfg.events.items())
+    ei = 0
 
-        
-        if t in cfg.events:
-            for cmd in cfg.events[t]:
-                dss.Command(cmd)
+    prev_soc = 40.0  # safe default
+
+    t = 0
+    while t < MINUTES:
+
+        fired = False
+        while ei < len(events) and events[ei][0] == t:
+            # one boundary crossing for the whole pre-built event batch
+            dss.Text.Commands(events[ei][1])
+            ei += 1
+            fired = True
+
+        next_event = events[ei][0] if ei < len(events) else MINUTES
+
+        # quiescent window? -> one coarse solve instead of COARSE_STEP fine ones
+        step = 1
+        if (COARSE_STEP > 1 and t >= 2 and not fired
+                and t + COARSE_STEP <= MINUTES
+                and next_event - t >= COARSE_EVENT_GAP
+                and res.island_flag[t - 1] == 0
+                and res.bat_kw[t - 1] < 1e-6
+                and abs(res.soc_pct[t - 1] - res.soc_pct[t - 2]) < 1e-6
+                and abs(res.pv_kw[t - 1] - res.pv_kw[t - 2]) < PV_SMOOTH_EPS_KW):
+            step = COARSE_STEP
+            dss.Command(f"set stepsize={COARSE_STEP}m")
 
-        
         dss.Command("solve")
 
-        
+        if step > 1:
+            dss.Command("set stepsize=1m")
+            t += step - 1   # minute the coarse solve landed on; gap filled below
+
+
         island = is_islanded_via_dummy()
-        res.island_flag.append(1 if island else 0)
+        res.island_flag[t] = 1 if island else 0
 
-        
-        pv_kw = get_pv_kw()
-        res.pv_kw.append(pv_kw)
 
+        pv_kw = get_pv_kw()
+        res.pv_kw[t] = pv_kw
 
-        soc_after = bess_control_step(island, pv_kw, prev_soc, enabled=cfg.bess_enabled)
 
-        soc, bat_kw = get_bess_soc_and_power()
-        soc = soc if soc > 0 else soc_after
-        res.soc_pct.append(soc)
-        res.bat_kw.append(bat_kw)
+        soc, bat_kw = bess_control_step(island, pv_kw, prev_soc, enabled=cfg.bess_enabled)
+        res.soc_pct[t] = soc
+        res.bat_kw[t] = bat_kw
         prev_soc = soc
 
-        if island and (soc > (RESERVE_PCT + SOC_HYST)):
-            res.stability_minutes += 1
 
-  
-        for h in HOMES:
-            res.voltages[h].append(get_bus_voltage_v(h))
+        read_home_voltages(home_idx, res.voltages[:, t])
+
+
+        load_kw = get_total_load_kw(load_buf)
+        res.load_kw[t] = load_kw
+
+        res.supply_kw[t] = max(0.0, pv_kw + bat_kw)
 
+        if step > 1:
+            _fill_skipped_minutes(res, t, step)
 
-        load_kw = get_total_load_kw(HOMES)
-        res.load_kw.append(load_kw)
+        t += 1
 
-        res.supply_kw.append(max(0.0, pv_kw + bat_kw))
+    # one vectorized pass instead of a per-minute branch in the hot loop
+    # (interpolated minutes are grid-connected, so they never count)
+    res.stability_minutes = int(np.logical_and(
+        res.island_flag == 1,
+        res.soc_pct > (RESERVE_PCT + SOC_HYST),
+    ).sum())
 
     return res
 
@@ -439,9 +732,28 @@ def main() -> None:
     scenarios = [scenario_2(), scenario_3(), scenario_4()]
     summary = {}
 
+    # Resolve cache hits first, then simulate the misses in parallel:
+    # scenarios share no state, and each worker process gets its own
+    # OpenDSS instance (opendssdirect is not thread-safe in-process).
+    results = {}
+    missing = []
     for cfg in scenarios:
-        
-        res = run_scenario(cfg)
+        res = load_cached_results(cfg)
+        if res is not None:
+            print(f"Cache hit: {cfg.name} (skipping simulation)")
+            results[cfg.name] = res
+        else:
+            missing.append(cfg)
+
+    if missing:
+        with ProcessPoolExecutor(max_workers=len(missing)) as ex:
+            for cfg, res in zip(missing, ex.map(run_scenario, missing)):
+                results[cfg.name] = res
+                save_cached_results(cfg, res)
+
+    for cfg in scenarios:
+
+        res = results[cfg.name]
 
         summary[cfg.name] = {
             "description": cfg.description,
@@ -451,28 +763,25 @@ def main() -> None:
             "stability_minutes": res.stability_minutes,
         }
 
-        # Plots
-        pf_png = os.path.join(RESULTS_DIR, f"{cfg.name}_powerflow.png")
-        vs_png = os.path.join(RESULTS_DIR, f"{cfg.name}_voltage_band_soc.png")
-
-        plot_power_flow(
-            res,
-            title=f"{cfg.name}: Power Flow",
-            out_png=pf_png
-        )
+        # Plots (one combined figure per scenario)
+        out_png = os.path.join(RESULTS_DIR, f"{cfg.name}.png")
 
-        plot_voltage_band_and_soc(
+        plot_scenario(
             res,
-            title=f"{cfg.name}: Voltage Band + Mean Voltage | SoC (Stability={res.stability_minutes} min)",
-            out_png=vs_png,
+            title=f"{cfg.name}: Power Flow | Voltage Band | SoC (Stability={res.stability_minutes} min)",
+            out_png=out_png,
             vref=230.0
         )
 
-        print(f"Saved: {pf_png}")
-        print(f"Saved: {vs_png}")
+        print(f"Saved: {out_png}")
 
-    with open(os.path.join(RESULTS_DIR, "summary.json"), "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    summary_path = os.path.join(RESULTS_DIR, "summary.json")
+    if HAVE_ORJSON:
+        with open(summary_path, "wb") as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
 
     print("\nAll done. Results saved in ./results/")
 